@@ -1,5 +1,24 @@
-from src.agents.base_agent import BaseAgent
-from src.agents.product_manager import ProductManagerAgent
-from src.agents.developer import DeveloperAgent
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.agents.base_agent import BaseAgent
+    from src.agents.developer import DeveloperAgent
+    from src.agents.product_manager import ProductManagerAgent
 
 __all__ = ["BaseAgent", "ProductManagerAgent", "DeveloperAgent"]
+
+# Exports are resolved on first access (PEP 562) so importing one agent doesn't load the others.
+_EXPORTS = {
+    "BaseAgent": "src.agents.base_agent",
+    "ProductManagerAgent": "src.agents.product_manager",
+    "DeveloperAgent": "src.agents.developer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _EXPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -2,13 +2,19 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
+import threading
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from src.tools.github_client import GitHubClient
-from src.tools.linear_client import LinearClient
-from src.tools.slack_client import SlackClient
+if TYPE_CHECKING:
+    import httpx
+
+    from src.tools.github_client import GitHubClient
+    from src.tools.linear_client import LinearClient
+    from src.tools.slack_client import SlackClient
 
 logger = logging.getLogger(__name__)
 
@@ -20,18 +26,28 @@ class AgentStatus(Enum):
     ERRORED = auto()
 
 
+@dataclass(slots=True, repr=False, eq=False)
 class Event:
     """A typed event flowing through the agent system."""
 
-    __slots__ = ("kind", "source", "payload")
+    kind: str
+    source: str
+    payload: dict[str, Any]
+    _repr: str | None = field(default=None, init=False)
 
-    def __init__(self, kind: str, source: str, payload: dict[str, Any]) -> None:
-        self.kind = kind
-        self.source = source
-        self.payload = payload
+    def __post_init__(self) -> None:
+        # Kinds and sources come from a small fixed set; interning makes routing lookups pointer compares.
+        self.kind = sys.intern(self.kind)
+        self.source = sys.intern(self.source)
 
     def __repr__(self) -> str:
-        return f"Event(kind={self.kind!r}, source={self.source!r})"
+        if self._repr is None:
+            self._repr = f"Event(kind={self.kind!r}, source={self.source!r})"
+        return self._repr
+
+
+# Pushed onto an agent's queue by ``stop()`` to wake the event loop for shutdown.
+_SHUTDOWN_SENTINEL = Event(kind="__shutdown__", source="agent", payload={})
 
 
 class ToolBox:
@@ -42,15 +58,19 @@ class ToolBox:
         linear: LinearClient | None = None,
         github: GitHubClient | None = None,
         slack: SlackClient | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         self.linear = linear
         self.github = github
         self.slack = slack
+        self.transport = transport
 
     async def close(self) -> None:
         for client in (self.linear, self.github, self.slack):
             if client:
                 await client.close()
+        if self.transport:
+            await self.transport.aclose()
 
 
 class BaseAgent(ABC):
@@ -59,22 +79,33 @@ class BaseAgent(ABC):
     Subclasses must implement:
         - handle_event: React to an incoming event.
         - poll: Perform periodic work (check for new tasks, etc.).
+
+    Subclasses declare the event kinds they handle in ``SUBSCRIBED_KINDS``; the
+    orchestrator only routes those kinds to the agent.
     """
 
+    SUBSCRIBED_KINDS: ClassVar[frozenset[str]] = frozenset()
+
     def __init__(self, name: str, tools: ToolBox, config: dict[str, Any]) -> None:
         self.name = name
         self.tools = tools
         self.config = config
         self.status = AgentStatus.IDLE
-        self._event_queue: asyncio.Queue[Event] = asyncio.Queue()
+        self._event_queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=config.get("event_queue_max", 1024))
+        self._stop_event = asyncio.Event()
+        self._poll_wake = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
         self._poll_interval: float = config.get("poll_interval_seconds", 30)
-        self._max_retries: int = config.get("max_retries", 3)
+        self._max_retries: int = config.get("max_retries", 1)
         self._retry_backoff: float = config.get("retry_backoff_seconds", 5)
 
     # ── public interface ────────────────────────────────────────────
 
     async def start(self) -> None:
         """Run the agent's poll + event loops concurrently."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
         self.status = AgentStatus.RUNNING
         logger.info("%s agent started", self.name)
         try:
@@ -90,9 +121,35 @@ class BaseAgent(ABC):
     async def stop(self) -> None:
         self.status = AgentStatus.STOPPING
         logger.info("%s agent stopping", self.name)
+        self._stop_event.set()
+        self._poll_wake.set()
+        self._enqueue(_SHUTDOWN_SENTINEL)
 
     def push_event(self, event: Event) -> None:
-        self._event_queue.put_nowait(event)
+        """Enqueue an event, dropping the oldest queued one if the queue is full.
+
+        Safe to call from threads other than the agent's loop.
+        """
+        if self._loop is None or threading.get_ident() == self._loop_thread:
+            self._enqueue(event)
+        else:
+            self._loop.call_soon_threadsafe(self._enqueue, event)
+
+    async def put_event(self, event: Event, timeout: float) -> bool:
+        """Enqueue an event, waiting up to ``timeout`` seconds for queue space.
+
+        Returns False (and drops the event) if the queue stayed full.
+        """
+        try:
+            await asyncio.wait_for(self._event_queue.put(event), timeout=timeout)
+        except TimeoutError:
+            logger.warning("%s event queue full, dropping %s", self.name, event)
+            return False
+        return True
+
+    def request_poll(self) -> None:
+        """Run the next poll immediately instead of waiting out the poll interval."""
+        self._poll_wake.set()
 
     # ── abstract methods ────────────────────────────────────────────
 
@@ -112,14 +169,15 @@ class BaseAgent(ABC):
                 await self.poll()
             except Exception:
                 logger.exception("%s poll error", self.name)
-            await asyncio.sleep(self._poll_interval)
+            if await self._interruptible_sleep(self._poll_interval, wake=self._poll_wake):
+                break
+            self._poll_wake.clear()
 
     async def _event_loop(self) -> None:
         while self.status == AgentStatus.RUNNING:
-            try:
-                event = await asyncio.wait_for(self._event_queue.get(), timeout=1.0)
-            except TimeoutError:
-                continue
+            event = await self._event_queue.get()
+            if event is _SHUTDOWN_SENTINEL or self._stop_event.is_set():
+                break
             await self._dispatch_event(event)
 
     async def _dispatch_event(self, event: Event) -> None:
@@ -135,6 +193,32 @@ class BaseAgent(ABC):
                     attempt,
                     self._max_retries,
                 )
-                if attempt < self._max_retries:
-                    await asyncio.sleep(self._retry_backoff * attempt)
+                if attempt < self._max_retries and await self._interruptible_sleep(self._retry_backoff * attempt):
+                    logger.warning("%s dropping %s: agent is stopping", self.name, event)
+                    return
         logger.error("%s gave up on %s after %d retries", self.name, event, self._max_retries)
+
+    def _enqueue(self, event: Event) -> None:
+        try:
+            self._event_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            dropped = self._event_queue.get_nowait()
+            logger.warning("%s event queue full, dropping oldest %s", self.name, dropped)
+            self._event_queue.put_nowait(event)
+            self._event_dropped(dropped)
+
+    def _event_dropped(self, event: Event) -> None:
+        """Hook for subclasses that track queued events; called when one is discarded unhandled."""
+
+    async def _interruptible_sleep(self, seconds: float, wake: asyncio.Event | None = None) -> bool:
+        """Sleep for ``seconds`` unless ``stop()`` is called or ``wake`` is set first.
+
+        ``wake`` must also be set by ``stop()`` so a stop request still interrupts the sleep.
+        Returns True if the sleep was cut short by a stop request.
+        """
+        try:
+            async with asyncio.timeout(seconds):
+                await (wake or self._stop_event).wait()
+        except TimeoutError:
+            pass
+        return self._stop_event.is_set()
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from src.agents.base_agent import BaseAgent, Event, ToolBox
+from src.tools.claude_code import ClaudeWorkerPool
 
 logger = logging.getLogger(__name__)
 
@@ -12,46 +13,99 @@ logger = logging.getLogger(__name__)
 class DeveloperAgent(BaseAgent):
     """Picks up assigned Linear tickets, writes code via Claude Code CLI, and opens PRs."""
 
+    SUBSCRIBED_KINDS = frozenset({
+        "ticket_assigned",
+        "pr_review_requested",
+        "linear_issue_created",
+        "linear_issue_updated",
+    })
+
     def __init__(self, tools: ToolBox, config: dict[str, Any]) -> None:
         super().__init__(name="Developer", tools=tools, config=config)
         self._github_org: str = config.get("github_org", "")
         self._branch_prefix: str = config.get("branch_prefix", "ai/")
         self._auto_pr: bool = config.get("auto_pr", True)
         self._max_concurrent: int = config.get("max_concurrent_tickets", 2)
-        self._active_tickets: set[str] = set()
-        self._assignee_id: str | None = None
+        self._review_state_name: str = config.get("review_state_name", "In Review")
+        self._review_state_ids: dict[str, str | None] = {}
+        self._slots = asyncio.Semaphore(self._max_concurrent)
+        # Tickets queued or being worked on; poll() skips these so each is implemented once.
+        self._in_flight: set[str] = set()
+        self._ticket_tasks: dict[str, asyncio.Task[None]] = {}
+        self._claude = ClaudeWorkerPool(size=self._max_concurrent)
+        self._assignee_id: str | None = config.get("linear_assignee_id")
+        self._handlers: dict[str, Callable[[dict[str, Any]], Awaitable[None]]] = {
+            "ticket_assigned": self._start_ticket,
+            "pr_review_requested": self._handle_review_feedback,
+            "linear_issue_created": self._on_linear_issue_change,
+            "linear_issue_updated": self._on_linear_issue_change,
+        }
+
+    async def stop(self) -> None:
+        await super().stop()
+        tasks = list(self._ticket_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._claude.close()
 
     async def poll(self) -> None:
         """Check Linear for tickets in 'Todo' assigned to this agent."""
-        if not self.tools.linear or not self._assignee_id:
+        if not self.tools.linear:
             return
-        if len(self._active_tickets) >= self._max_concurrent:
+        if self._assignee_id is None:
+            # Default to the user the API key belongs to.
+            self._assignee_id = await self.tools.linear.get_viewer_id()
+            logger.info("%s picking up tickets assigned to Linear user %s", self.name, self._assignee_id)
+        if self._slots.locked():
             return
 
         tickets = await self.tools.linear.get_assigned_issues(self._assignee_id, state_name="Todo")
         for ticket in tickets:
-            if ticket["id"] not in self._active_tickets:
+            if ticket["id"] not in self._in_flight:
+                self._in_flight.add(ticket["id"])
                 self.push_event(Event(kind="ticket_assigned", source="poll", payload=ticket))
 
     async def handle_event(self, event: Event) -> None:
-        match event.kind:
-            case "ticket_assigned":
-                await self._work_on_ticket(event.payload)
-            case "pr_review_requested":
-                await self._handle_review_feedback(event.payload)
-            case _:
-                logger.debug("%s ignoring event kind=%s", self.name, event.kind)
+        handler = self._handlers.get(event.kind)
+        if handler is None:
+            logger.debug("%s ignoring event kind=%s", self.name, event.kind)
+            return
+        await handler(event.payload)
 
     # ── internal logic ──────────────────────────────────────────────
 
-    async def _work_on_ticket(self, ticket: dict[str, Any]) -> None:
-        ticket_id = ticket["id"]
-        identifier = ticket["identifier"]
+    async def _on_linear_issue_change(self, issue: dict[str, Any]) -> None:
+        # The webhook payload shape differs from the GraphQL nodes poll() works with,
+        # so let poll() fetch the ticket rather than building it from the webhook.
+        if self._assignee_id and issue.get("assigneeId") == self._assignee_id:
+            self.request_poll()
 
-        if ticket_id in self._active_tickets:
+    async def _start_ticket(self, ticket: dict[str, Any]) -> None:
+        # Run the ticket in the background so the event loop keeps pulling tickets and
+        # up to max_concurrent_tickets of them are implemented at once.
+        ticket_id = ticket["id"]
+        if ticket_id in self._ticket_tasks:
             return
-        self._active_tickets.add(ticket_id)
+        self._in_flight.add(ticket_id)
+        task = asyncio.create_task(self._work_on_ticket(ticket))
+        self._ticket_tasks[ticket_id] = task
+        task.add_done_callback(lambda _: self._ticket_tasks.pop(ticket_id, None))
+
+    async def _work_on_ticket(self, ticket: dict[str, Any]) -> None:
+        try:
+            async with self._slots:
+                await self._implement_ticket(ticket)
+        finally:
+            self._in_flight.discard(ticket["id"])
 
+    def _event_dropped(self, event: Event) -> None:
+        # A dropped ticket_assigned must not stay in-flight, or poll() would never re-queue it.
+        if event.kind == "ticket_assigned":
+            self._in_flight.discard(event.payload["id"])
+
+    async def _implement_ticket(self, ticket: dict[str, Any]) -> None:
+        identifier = ticket["identifier"]
         logger.info("Starting work on %s: %s", identifier, ticket["title"])
         try:
             branch_name = f"{self._branch_prefix}{identifier.lower()}"
@@ -76,15 +130,20 @@ class DeveloperAgent(BaseAgent):
                 )
                 logger.info("Opened PR #%d for %s", pr["number"], identifier)
 
+                # Post-PR updates are independent of each other, so run them concurrently.
+                updates = []
                 if self.tools.slack:
-                    await self.tools.slack.post_message(
+                    updates.append(self.tools.slack.post_message(
                         "engineering",
                         f"PR opened for *{identifier}*: {pr['html_url']}",
-                    )
+                    ))
+                if self.tools.linear:
+                    updates.append(self._move_to_review(ticket))
+                for result in await asyncio.gather(*updates, return_exceptions=True):
+                    if isinstance(result, Exception):
+                        logger.error("Post-PR update failed for %s: %s", identifier, result)
         except Exception:
             logger.exception("Failed to complete %s", identifier)
-        finally:
-            self._active_tickets.discard(ticket_id)
 
     async def _run_claude_code(self, repo: str, branch: str, ticket: dict[str, Any]) -> None:
         prompt = (
@@ -94,17 +153,20 @@ class DeveloperAgent(BaseAgent):
             f"Work on branch '{branch}' in repo '{self._github_org}/{repo}'. "
             f"Commit your changes with a message referencing {ticket['identifier']}."
         )
-        proc = await asyncio.create_subprocess_exec(
-            "claude", "--yes", "--print", prompt,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
-        if proc.returncode != 0:
-            raise RuntimeError(
-                f"Claude Code exited with {proc.returncode}: {stderr.decode()[:500]}"
+        output = await self._claude.run(prompt)
+        logger.info("Claude Code output for %s:\n%s", ticket["identifier"], output[:1000])
+
+    async def _move_to_review(self, ticket: dict[str, Any]) -> None:
+        assert self.tools.linear
+        if not (team_id := ticket.get("team", {}).get("id")):
+            return
+        if team_id not in self._review_state_ids:
+            states = await self.tools.linear.get_workflow_states(team_id)
+            self._review_state_ids[team_id] = next(
+                (s["id"] for s in states if s["name"] == self._review_state_name), None
             )
-        logger.info("Claude Code output for %s:\n%s", ticket["identifier"], stdout.decode()[:1000])
+        if state_id := self._review_state_ids[team_id]:
+            await self.tools.linear.update_issue_state(ticket["id"], state_id)
 
     async def _handle_review_feedback(self, payload: dict[str, Any]) -> None:
         logger.info("Review feedback received for PR #%s \u2014 re-running implementation", payload.get("pr_number"))
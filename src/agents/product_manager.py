@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from src.agents.base_agent import BaseAgent, Event, ToolBox
 
@@ -11,12 +11,18 @@ logger = logging.getLogger(__name__)
 class ProductManagerAgent(BaseAgent):
     """Converts ideas and feature requests into structured Linear epics and tickets."""
 
+    SUBSCRIBED_KINDS = frozenset({"idea_submitted", "feedback_received"})
+
     def __init__(self, tools: ToolBox, config: dict[str, Any]) -> None:
         super().__init__(name="ProductManager", tools=tools, config=config)
         self._team_key: str = config.get("linear_team_key", "ENG")
         self._default_priority: int = config.get("default_priority", 3)
         self._team_id: str | None = None
         self._workflow_states: dict[str, str] = {}
+        self._handlers: dict[str, Callable[[dict[str, Any]], Awaitable[None]]] = {
+            "idea_submitted": self._process_idea,
+            "feedback_received": self._triage_feedback,
+        }
 
     async def poll(self) -> None:
         """Ensure team metadata is cached on each poll cycle."""
@@ -24,13 +30,11 @@ class ProductManagerAgent(BaseAgent):
             await self._cache_team_metadata()
 
     async def handle_event(self, event: Event) -> None:
-        match event.kind:
-            case "idea_submitted":
-                await self._process_idea(event.payload)
-            case "feedback_received":
-                await self._triage_feedback(event.payload)
-            case _:
-                logger.debug("%s ignoring event kind=%s", self.name, event.kind)
+        handler = self._handlers.get(event.kind)
+        if handler is None:
+            logger.debug("%s ignoring event kind=%s", self.name, event.kind)
+            return
+        await handler(event.payload)
 
     # ── internal logic ──────────────────────────────────────────────
 
@@ -56,14 +60,17 @@ class ProductManagerAgent(BaseAgent):
         logger.info("Created epic %s: %s", epic["identifier"], epic["url"])
 
         # Break down into sub-tickets if breakdown is provided
-        for task in payload.get("breakdown", []):
-            sub = await self.tools.linear.create_issue(
+        subs = await self.tools.linear.create_issues_bulk([
+            self.tools.linear.issue_input(
                 team_id=self._team_id,
                 title=task["title"],
                 description=task.get("description", ""),
                 priority=task.get("priority", self._default_priority),
                 parent_id=epic["id"],
             )
+            for task in payload.get("breakdown", [])
+        ])
+        for sub in subs:
             logger.info("  Created sub-ticket %s", sub["identifier"])
 
         # Notify Slack
@@ -3,38 +3,64 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import importlib
 import logging
 import os
+import queue
 import signal
+from collections import defaultdict
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
+import httpx
 import uvicorn
 import yaml
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
+
 from src.agents.base_agent import BaseAgent, Event, ToolBox
 from src.tools.github_client import GitHubClient
 from src.tools.linear_client import LinearClient
 from src.tools.slack_client import SlackClient
 from src.webhook_server import create_app
 
+
+def _configure_logging() -> None:
+    """Log through a queue so stderr writes happen on a listener thread, not the event loop."""
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    # QueueHandler formats the record before enqueueing, so the listener's handler writes it as-is.
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        handlers=[QueueHandler(log_queue)],
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+
 load_dotenv()
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-)
+_configure_logging()
 logger = logging.getLogger(__name__)
 
 ROOT = Path(__file__).resolve().parent.parent
 
+# How long a webhook may wait on a full agent queue before the event is dropped.
+ROUTE_TIMEOUT_SECONDS = 5.0
+
 
 class Orchestrator:
     """Boots agents from config, runs them as concurrent async tasks, and routes events."""
 
     def __init__(self) -> None:
         self._agents: dict[str, BaseAgent] = {}
+        self._subs: dict[str, list[BaseAgent]] = defaultdict(list)
         self._tools: ToolBox | None = None
         self._shutdown = asyncio.Event()
 
@@ -46,13 +72,20 @@ class Orchestrator:
             return yaml.safe_load(f)
 
     def _build_toolbox(self) -> ToolBox:
-        tools = ToolBox()
+        # One connection pool shared by every tool client; httpx keys connections by origin.
+        # Transport retries only cover failed connection attempts, so they are safe for POSTs.
+        transport = httpx.AsyncHTTPTransport(
+            retries=3,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        tools = ToolBox(transport=transport)
         if key := os.getenv("LINEAR_API_KEY"):
-            tools.linear = LinearClient(api_key=key)
+            tools.linear = LinearClient(api_key=key, transport=transport)
         if token := os.getenv("GITHUB_TOKEN"):
-            tools.github = GitHubClient(token=token)
+            tools.github = GitHubClient(token=token, transport=transport)
         if token := os.getenv("SLACK_BOT_TOKEN"):
-            tools.slack = SlackClient(bot_token=token)
+            tools.slack = SlackClient(bot_token=token, transport=transport)
         return tools
 
     def _instantiate_agents(self, config: dict[str, Any]) -> None:
@@ -65,6 +98,8 @@ class Orchestrator:
             cls = self._import_class(agent_cfg["class"])
             agent = cls(tools=self._tools, config=merged)
             self._agents[name] = agent
+            for kind in cls.SUBSCRIBED_KINDS:
+                self._subs[kind].append(agent)
             logger.info("Registered agent: %s (%s)", name, cls.__name__)
 
     @staticmethod
@@ -76,9 +111,22 @@ class Orchestrator:
     # ── event routing ───────────────────────────────────────────
 
     async def _route_event(self, event: Event) -> None:
+        agents = self._subs.get(event.kind, ())
+        if not agents:
+            logger.debug("No agent subscribed to %s", event)
+            return
         logger.info("Routing event: %s", event)
-        for agent in self._agents.values():
-            agent.push_event(event)
+        for agent in agents:
+            await agent.put_event(event, timeout=ROUTE_TIMEOUT_SECONDS)
+
+    async def _route_events(self, events: list[Event]) -> None:
+        routed = 0
+        for event in events:
+            if agents := self._subs.get(event.kind):
+                routed += 1
+                for agent in agents:
+                    await agent.put_event(event, timeout=ROUTE_TIMEOUT_SECONDS)
+        logger.info("Routed %d of %d webhook event(s)", routed, len(events))
 
     # ── lifecycle ───────────────────────────────────────────────
 
@@ -88,13 +136,19 @@ class Orchestrator:
         self._instantiate_agents(config)
 
         webhook_secret = os.getenv("WEBHOOK_SECRET", "")
-        app = create_app(webhook_secret=webhook_secret, on_event=self._route_event)
+        app = create_app(
+            webhook_secret=webhook_secret,
+            on_event=self._route_event,
+            on_event_batch=self._route_events,
+        )
 
         server_config = uvicorn.Config(
             app,
             host="0.0.0.0",
             port=int(os.getenv("PORT", "8000")),
             log_level="info",
+            log_config=None,  # keep uvicorn's loggers on the root queue handler
+            loop="uvloop" if uvloop else "asyncio",
         )
         server = uvicorn.Server(server_config)
 
@@ -127,4 +181,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -1,5 +1,24 @@
-from src.tools.linear_client import LinearClient
-from src.tools.github_client import GitHubClient
-from src.tools.slack_client import SlackClient
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.tools.github_client import GitHubClient
+    from src.tools.linear_client import LinearClient
+    from src.tools.slack_client import SlackClient
 
 __all__ = ["LinearClient", "GitHubClient", "SlackClient"]
+
+# Exports are resolved on first access (PEP 562) so the httpx import chain is only paid when used.
+_EXPORTS = {
+    "LinearClient": "src.tools.linear_client",
+    "GitHubClient": "src.tools.github_client",
+    "SlackClient": "src.tools.slack_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _EXPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# One JSON user message on stdin, one JSON message per stdout line until the turn's result.
+WORKER_COMMAND = (
+    "claude", "--yes", "--print", "--verbose",
+    "--input-format", "stream-json",
+    "--output-format", "stream-json",
+)
+ONE_SHOT_COMMAND = ("claude", "--yes", "--print")
+
+# stream-json lines carry whole tool outputs, well past asyncio's 64 KiB readline default.
+STREAM_LIMIT = 16 * 1024 * 1024
+# Trailing stderr bytes kept per worker for error messages.
+STDERR_TAIL_BYTES = 4096
+
+
+class _ClaudeWorker:
+    """A pre-started Claude Code process that runs exactly one prompt in a fresh session."""
+
+    def __init__(self, proc: asyncio.subprocess.Process) -> None:
+        self._proc = proc
+        self._stderr_tail = bytearray()
+        # stderr must be drained continuously or a chatty process blocks on a full pipe.
+        self._stderr_reader = asyncio.create_task(self._drain_stderr())
+
+    @classmethod
+    async def spawn(cls) -> _ClaudeWorker:
+        proc = await asyncio.create_subprocess_exec(
+            *WORKER_COMMAND,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=STREAM_LIMIT,
+        )
+        return cls(proc)
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.returncode is None
+
+    async def run(self, prompt: str) -> str:
+        assert self._proc.stdin and self._proc.stdout
+        message = {"type": "user", "message": {"role": "user", "content": prompt}}
+        self._proc.stdin.write(orjson.dumps(message) + b"\n")
+        await self._proc.stdin.drain()
+        # EOF ends the session once this turn completes, so the process is never reused.
+        self._proc.stdin.close()
+        while line := await self._proc.stdout.readline():
+            msg: dict[str, Any] = orjson.loads(line)
+            if msg.get("type") != "result":
+                continue
+            if msg.get("is_error"):
+                raise RuntimeError(f"Claude Code failed: {str(msg.get('result', msg.get('subtype')))[:500]}")
+            return msg.get("result", "")
+        returncode = await self._proc.wait()
+        await self._stderr_reader
+        raise RuntimeError(
+            f"Claude Code exited with {returncode}: {self._stderr_tail.decode(errors='replace')[-500:]}"
+        )
+
+    async def close(self) -> None:
+        if self._proc.returncode is None:
+            self._proc.terminate()
+            await self._proc.wait()
+        await self._stderr_reader
+
+    async def _drain_stderr(self) -> None:
+        assert self._proc.stderr
+        while chunk := await self._proc.stderr.read(STDERR_TAIL_BYTES):
+            self._stderr_tail += chunk
+            del self._stderr_tail[:-STDERR_TAIL_BYTES]
+
+
+class ClaudeWorkerPool:
+    """Keeps up to ``size`` Claude Code processes started ahead of need.
+
+    Each process runs a single ticket in a fresh session and is then discarded, while a
+    replacement starts in the background; tickets get a warm process without sharing any
+    conversation context. When no warm process is free, prompts run through a one-shot
+    ``claude --print`` process instead of waiting.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._idle: list[_ClaudeWorker] = []
+        self._spawned = 0
+        self._warming: set[asyncio.Task[None]] = set()
+
+    async def run(self, prompt: str) -> str:
+        worker = await self._acquire()
+        if worker is None:
+            return await self._run_one_shot(prompt)
+        try:
+            return await worker.run(prompt)
+        finally:
+            await worker.close()
+            self._spawned -= 1
+            self._warm()
+
+    async def close(self) -> None:
+        for task in self._warming:
+            task.cancel()
+        await asyncio.gather(*self._warming, return_exceptions=True)
+        idle, self._idle = self._idle, []
+        for worker in idle:
+            await worker.close()
+            self._spawned -= 1
+
+    async def _acquire(self) -> _ClaudeWorker | None:
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.alive:
+                return worker
+            self._spawned -= 1
+            await worker.close()
+        if self._spawned >= self._size:
+            return None
+        self._spawned += 1
+        try:
+            return await _ClaudeWorker.spawn()
+        except Exception:
+            self._spawned -= 1
+            raise
+
+    def _warm(self) -> None:
+        """Start a replacement process in the background if the pool is below ``size``."""
+        if self._spawned >= self._size:
+            return
+        self._spawned += 1
+        task = asyncio.create_task(self._spawn_idle())
+        self._warming.add(task)
+        task.add_done_callback(self._warming.discard)
+
+    async def _spawn_idle(self) -> None:
+        try:
+            self._idle.append(await _ClaudeWorker.spawn())
+        except asyncio.CancelledError:
+            self._spawned -= 1
+            raise
+        except Exception:
+            self._spawned -= 1
+            logger.exception("Failed to pre-start a Claude Code worker")
+
+    @staticmethod
+    async def _run_one_shot(prompt: str) -> str:
+        proc = await asyncio.create_subprocess_exec(
+            *ONE_SHOT_COMMAND, prompt,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"Claude Code exited with {proc.returncode}: {stderr.decode()[:500]}"
+            )
+        return stdout.decode()
@@ -4,41 +4,49 @@ import logging
 from typing import Any
 
 import httpx
+import orjson
+
+from src.tools.http_client import BaseHTTPClient
 
 logger = logging.getLogger(__name__)
 
 API_BASE = "https://api.github.com"
 
+# Conditional-request entries kept per client; the oldest entry is evicted first.
+MAX_ETAG_CACHE = 512
+
 
-class GitHubClient:
+class GitHubClient(BaseHTTPClient):
     """Async wrapper around the GitHub REST API."""
 
-    def __init__(self, token: str) -> None:
-        self._http = httpx.AsyncClient(
+    def __init__(self, token: str, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        super().__init__(
             base_url=API_BASE,
             headers={
                 "Authorization": f"Bearer {token}",
                 "Accept": "application/vnd.github+json",
                 "X-GitHub-Api-Version": "2022-11-28",
+                "Content-Type": "application/json",
             },
             timeout=30.0,
+            transport=transport,
         )
+        self._etag_cache: dict[str, tuple[str, Any]] = {}
+        self._default_branches: dict[str, str] = {}
 
     async def create_branch(self, owner: str, repo: str, branch: str, from_sha: str) -> dict[str, Any]:
-        resp = await self._http.post(
+        return await self._http_post_json(
             f"/repos/{owner}/{repo}/git/refs",
-            json={"ref": f"refs/heads/{branch}", "sha": from_sha},
+            {"ref": f"refs/heads/{branch}", "sha": from_sha},
         )
-        resp.raise_for_status()
-        return resp.json()
 
     async def get_default_branch_sha(self, owner: str, repo: str) -> str:
-        resp = await self._http.get(f"/repos/{owner}/{repo}")
-        resp.raise_for_status()
-        default_branch = resp.json()["default_branch"]
-        ref_resp = await self._http.get(f"/repos/{owner}/{repo}/git/ref/heads/{default_branch}")
-        ref_resp.raise_for_status()
-        return ref_resp.json()["object"]["sha"]
+        full_name = f"{owner}/{repo}"
+        if (default_branch := self._default_branches.get(full_name)) is None:
+            repo_info = await self._get_conditional(f"/repos/{full_name}")
+            default_branch = self._default_branches[full_name] = repo_info["default_branch"]
+        ref = await self._get_conditional(f"/repos/{full_name}/git/ref/heads/{default_branch}")
+        return ref["object"]["sha"]
 
     async def create_pull_request(
         self,
@@ -49,25 +57,31 @@ class GitHubClient:
         base: str,
         body: str = "",
     ) -> dict[str, Any]:
-        resp = await self._http.post(
+        return await self._http_post_json(
             f"/repos/{owner}/{repo}/pulls",
-            json={"title": title, "head": head, "base": base, "body": body},
+            {"title": title, "head": head, "base": base, "body": body},
         )
-        resp.raise_for_status()
-        return resp.json()
 
     async def get_pr_status(self, owner: str, repo: str, pr_number: int) -> dict[str, Any]:
-        resp = await self._http.get(f"/repos/{owner}/{repo}/pulls/{pr_number}")
-        resp.raise_for_status()
-        return resp.json()
+        return await self._get_conditional(f"/repos/{owner}/{repo}/pulls/{pr_number}")
 
     async def list_open_prs(self, owner: str, repo: str) -> list[dict[str, Any]]:
-        resp = await self._http.get(
+        return await self._get_conditional(
             f"/repos/{owner}/{repo}/pulls",
             params={"state": "open", "per_page": 30},
         )
-        resp.raise_for_status()
-        return resp.json()
 
-    async def close(self) -> None:
-        await self._http.aclose()
+    async def _get_conditional(self, url: str, params: dict[str, Any] | None = None) -> Any:
+        """GET with ``If-None-Match``; a 304 returns the cached body and costs no rate limit."""
+        key = f"{url}?{httpx.QueryParams(params)}" if params else url
+        cached = self._etag_cache.get(key)
+        resp = await self._http.get(url, params=params, headers={"If-None-Match": cached[0]} if cached else None)
+        if resp.status_code == 304 and cached:
+            return cached[1]
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        if etag := resp.headers.get("etag"):
+            if len(self._etag_cache) >= MAX_ETAG_CACHE:
+                self._etag_cache.pop(next(iter(self._etag_cache)))
+            self._etag_cache[key] = (etag, data)
+        return data
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import orjson
+
+
+class BaseHTTPClient:
+    """Shared JSON-over-HTTP plumbing for the tool clients.
+
+    Subclasses pass their base URL and default headers (including a JSON
+    ``Content-Type``). Bodies are encoded and decoded with orjson rather than
+    httpx's stdlib ``json`` round-trip.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        timeout: float,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        # A shared transport is owned (and closed) by the ToolBox, not by this client.
+        self._owns_transport = transport is None
+        self._http = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            transport=transport,
+            http2=True,
+        )
+
+    async def _http_post_json(self, url: str, payload: Any) -> Any:
+        return await self._http_post_content(url, orjson.dumps(payload))
+
+    async def _http_post_content(self, url: str, content: bytes) -> Any:
+        """POST an already-serialized JSON body and decode the JSON response."""
+        resp = await self._http.post(url, content=content)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
+
+    async def close(self) -> None:
+        if self._owns_transport:
+            await self._http.aclose()
@@ -1,36 +1,97 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import orjson
+
+from src.tools.http_client import BaseHTTPClient
 
 logger = logging.getLogger(__name__)
 
 GRAPHQL_ENDPOINT = "https://api.linear.app/graphql"
 
+# Aliased issueCreate mutations sent per request by create_issues_bulk.
+MAX_BULK_MUTATIONS = 50
+
+_CREATE_ISSUE_MUTATION = """
+mutation CreateIssue($input: IssueCreateInput!) {
+    issueCreate(input: $input) {
+        success
+        issue { id identifier title url state { name } }
+    }
+}
+"""
+
+_UPDATE_ISSUE_MUTATION = """
+mutation UpdateIssue($id: String!, $input: IssueUpdateInput!) {
+    issueUpdate(id: $id, input: $input) {
+        success
+        issue { id identifier state { name } }
+    }
+}
+"""
+
+_VIEWER_QUERY = """
+query Viewer {
+    viewer { id }
+}
+"""
+
+_TEAMS_QUERY = """
+query Teams {
+    teams { nodes { id key name } }
+}
+"""
+
+_ASSIGNED_ISSUES_QUERY = """
+query AssignedIssues($assigneeId: ID!, $stateName: String!) {
+    issues(filter: {
+        assignee: { id: { eq: $assigneeId } }
+        state: { name: { eq: $stateName } }
+    }) {
+        nodes { id identifier title description priority team { id } labels { nodes { name } } }
+    }
+}
+"""
+
+_WORKFLOW_STATES_QUERY = """
+query WorkflowStates($teamId: ID!) {
+    workflowStates(filter: { team: { id: { eq: $teamId } } }) {
+        nodes { id name type position }
+    }
+}
+"""
+
+
+@lru_cache(maxsize=64)
+def _request_prefix(query: str) -> bytes:
+    """Serialized ``{"query": ...`` head of a request body, built once per query document."""
+    return orjson.dumps({"query": query})[:-1]
 
-class LinearClient:
+
+class LinearClient(BaseHTTPClient):
     """Async wrapper around the Linear GraphQL API."""
 
-    def __init__(self, api_key: str) -> None:
-        self._api_key = api_key
-        self._http = httpx.AsyncClient(
+    def __init__(self, api_key: str, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        super().__init__(
             base_url=GRAPHQL_ENDPOINT,
             headers={
                 "Authorization": api_key,
                 "Content-Type": "application/json",
             },
             timeout=30.0,
+            transport=transport,
         )
+        self._api_key = api_key
 
     async def _query(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
-        payload: dict[str, Any] = {"query": query}
+        content = _request_prefix(query)
         if variables:
-            payload["variables"] = variables
-        resp = await self._http.post("", json=payload)
-        resp.raise_for_status()
-        body = resp.json()
+            content += b',"variables":' + orjson.dumps(variables)
+        body = await self._http_post_content("", content + b"}")
         if errors := body.get("errors"):
             raise RuntimeError(f"Linear GraphQL errors: {errors}")
         return body["data"]
@@ -44,14 +105,39 @@ class LinearClient:
         labels: list[str] | None = None,
         parent_id: str | None = None,
     ) -> dict[str, Any]:
-        mutation = """
-        mutation CreateIssue($input: IssueCreateInput!) {
-            issueCreate(input: $input) {
-                success
-                issue { id identifier title url state { name } }
-            }
-        }
+        input_data = self.issue_input(team_id, title, description, priority, labels, parent_id)
+        data = await self._query(_CREATE_ISSUE_MUTATION, {"input": input_data})
+        return data["issueCreate"]["issue"]
+
+    async def create_issues_bulk(self, inputs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create several issues with one aliased GraphQL mutation per batch.
+
+        ``inputs`` are ``IssueCreateInput`` dicts (see ``issue_input``); issues are
+        returned in the same order.
         """
+        issues: list[dict[str, Any]] = []
+        for start in range(0, len(inputs), MAX_BULK_MUTATIONS):
+            batch = inputs[start : start + MAX_BULK_MUTATIONS]
+            params = ", ".join(f"$i{n}: IssueCreateInput!" for n in range(len(batch)))
+            fields = " ".join(
+                f"c{n}: issueCreate(input: $i{n}) {{ success issue {{ id identifier title url state {{ name }} }} }}"
+                for n in range(len(batch))
+            )
+            mutation = f"mutation BulkCreateIssues({params}) {{ {fields} }}"
+            data = await self._query(mutation, {f"i{n}": item for n, item in enumerate(batch)})
+            issues.extend(data[f"c{n}"]["issue"] for n in range(len(batch)))
+        return issues
+
+    @staticmethod
+    def issue_input(
+        team_id: str,
+        title: str,
+        description: str = "",
+        priority: int = 3,
+        labels: list[str] | None = None,
+        parent_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Build an ``IssueCreateInput`` payload."""
         input_data: dict[str, Any] = {
             "teamId": team_id,
             "title": title,
@@ -62,57 +148,28 @@ class LinearClient:
             input_data["labelIds"] = labels
         if parent_id:
             input_data["parentId"] = parent_id
-        data = await self._query(mutation, {"input": input_data})
-        return data["issueCreate"]["issue"]
+        return input_data
 
     async def update_issue_state(self, issue_id: str, state_id: str) -> dict[str, Any]:
-        mutation = """
-        mutation UpdateIssue($id: String!, $input: IssueUpdateInput!) {
-            issueUpdate(id: $id, input: $input) {
-                success
-                issue { id identifier state { name } }
-            }
-        }
-        """
-        data = await self._query(mutation, {"id": issue_id, "input": {"stateId": state_id}})
+        data = await self._query(_UPDATE_ISSUE_MUTATION, {"id": issue_id, "input": {"stateId": state_id}})
         return data["issueUpdate"]["issue"]
 
+    async def get_viewer_id(self) -> str:
+        """ID of the Linear user that owns the API key."""
+        data = await self._query(_VIEWER_QUERY)
+        return data["viewer"]["id"]
+
     async def get_team_id(self, team_key: str) -> str:
-        query = """
-        query Teams {
-            teams { nodes { id key name } }
-        }
-        """
-        data = await self._query(query)
+        data = await self._query(_TEAMS_QUERY)
         for team in data["teams"]["nodes"]:
             if team["key"] == team_key:
                 return team["id"]
         raise ValueError(f"Team with key '{team_key}' not found")
 
     async def get_assigned_issues(self, assignee_id: str, state_name: str = "Todo") -> list[dict[str, Any]]:
-        query = """
-        query AssignedIssues($assigneeId: ID!, $stateName: String!) {
-            issues(filter: {
-                assignee: { id: { eq: $assigneeId } }
-                state: { name: { eq: $stateName } }
-            }) {
-                nodes { id identifier title description priority labels { nodes { name } } }
-            }
-        }
-        """
-        data = await self._query(query, {"assigneeId": assignee_id, "stateName": state_name})
+        data = await self._query(_ASSIGNED_ISSUES_QUERY, {"assigneeId": assignee_id, "stateName": state_name})
         return data["issues"]["nodes"]
 
     async def get_workflow_states(self, team_id: str) -> list[dict[str, Any]]:
-        query = """
-        query WorkflowStates($teamId: ID!) {
-            workflowStates(filter: { team: { id: { eq: $teamId } } }) {
-                nodes { id name type position }
-            }
-        }
-        """
-        data = await self._query(query, {"teamId": team_id})
+        data = await self._query(_WORKFLOW_STATES_QUERY, {"teamId": team_id})
         return data["workflowStates"]["nodes"]
-
-    async def close(self) -> None:
-        await self._http.aclose()
@@ -5,28 +5,29 @@ from typing import Any
 
 import httpx
 
+from src.tools.http_client import BaseHTTPClient
+
 logger = logging.getLogger(__name__)
 
 API_BASE = "https://slack.com/api"
 
 
-class SlackClient:
+class SlackClient(BaseHTTPClient):
     """Async wrapper around the Slack Web API."""
 
-    def __init__(self, bot_token: str) -> None:
-        self._http = httpx.AsyncClient(
+    def __init__(self, bot_token: str, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        super().__init__(
             base_url=API_BASE,
             headers={
                 "Authorization": f"Bearer {bot_token}",
                 "Content-Type": "application/json; charset=utf-8",
             },
             timeout=15.0,
+            transport=transport,
         )
 
     async def _post(self, method: str, payload: dict[str, Any]) -> dict[str, Any]:
-        resp = await self._http.post(f"/{method}", json=payload)
-        resp.raise_for_status()
-        data = resp.json()
+        data = await self._http_post_json(f"/{method}", payload)
         if not data.get("ok"):
             raise RuntimeError(f"Slack API error ({method}): {data.get('error', 'unknown')}")
         return data
@@ -51,6 +52,3 @@ class SlackClient:
     async def get_channel_history(self, channel: str, limit: int = 10) -> list[dict[str, Any]]:
         data = await self._post("conversations.history", {"channel": channel, "limit": limit})
         return data.get("messages", [])
-
-    async def close(self) -> None:
-        await self._http.aclose()
@@ -1,80 +1,316 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import logging
+import os
+import re
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Any, Callable, Coroutine
 
-from fastapi import FastAPI, Header, HTTPException, Request
+import blake3
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.agents.base_agent import Event
 
 logger = logging.getLogger(__name__)
 
 EventCallback = Callable[[Event], Coroutine[Any, Any, None]]
+BatchEventCallback = Callable[[list[Event]], Coroutine[Any, Any, None]]
 
+# Webhook events buffered ahead of the dispatch workers; beyond this, webhooks get 503.
+EVENT_QUEUE_MAX = 10_000
+EVENT_WORKERS = os.cpu_count() or 4
+# Most events a dispatch worker hands to on_event_batch at once.
+EVENT_BATCH_MAX = 64
 
-def create_app(webhook_secret: str, on_event: EventCallback) -> FastAPI:
-    """Create a FastAPI application wired to push events into the agent system."""
+# Bodies above this are rejected with 413 before any hashing or parsing.
+MAX_BODY_BYTES = 10 * 1024 * 1024
+# Slow senders get 408 instead of holding a handler (and its buffer) open indefinitely.
+BODY_TIMEOUT_SECONDS = 30.0
+# Content-Length is client-supplied, so it only pre-sizes the buffer up to this much;
+# larger bodies grow the buffer as their chunks actually arrive.
+BODY_PRESIZE_MAX = 64 * 1024
 
-    app = FastAPI(title="AI Company Webhook Server", version="1.0.0")
+_LINEAR_EVENT_MAP: dict[str, str] = {
+    action: sys.intern(kind)
+    for action, kind in {
+        "create": "linear_issue_created",
+        "update": "linear_issue_updated",
+        "remove": "linear_issue_removed",
+    }.items()
+}
 
-    def _verify_signature(payload: bytes, signature: str, secret: str) -> bool:
-        expected = hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
-        return hmac.compare_digest(f"sha256={expected}", signature)
+# Fixed response bodies, serialized once.
+_HEALTH_BODY = orjson.dumps({"status": "ok"})
+_OK_BODY = orjson.dumps({"ok": True})
+
+
+def _json_response(content: Any, status_code: int = 200) -> Response:
+    return Response(content=orjson.dumps(content), status_code=status_code, media_type="application/json")
+
+
+@lru_cache(maxsize=256)
+def _github_event_kind(event: str, action: str) -> str:
+    # ~40 GitHub event types times a handful of actions, so this saturates quickly.
+    return sys.intern(f"github_{event}_{action}" if action else f"github_{event}")
+
+
+# Slack URL-verification payloads are tiny and carry "type" up front.
+_SLACK_CHALLENGE_MARKER = b'"url_verification"'
+_SLACK_CHALLENGE_RE = re.compile(rb'"challenge"\s*:\s*"([^"\\]*)"')
+
+# Context string for deriving the 32-byte BLAKE3 key from WEBHOOK_SECRET; producers must use the same.
+BLAKE3_KEY_CONTEXT = "ai-company-framework 2025 webhook signature v1"
+
+_SHA256_BLOCK_SIZE = 64
+_IPAD = bytes(x ^ 0x36 for x in range(256))
+_OPAD = bytes(x ^ 0x5C for x in range(256))
+
+
+def _hmac_sha256_states(key: bytes) -> tuple[Any, Any]:
+    """Return SHA-256 states already fed the RFC 2104 inner and outer padded keys."""
+    if len(key) > _SHA256_BLOCK_SIZE:
+        key = hashlib.sha256(key).digest()
+    key = key.ljust(_SHA256_BLOCK_SIZE, b"\0")
+    return hashlib.sha256(key.translate(_IPAD)), hashlib.sha256(key.translate(_OPAD))
+
+
+class _BodySizeLimit:
+    """ASGI middleware that answers 413 when Content-Length exceeds ``max_bytes``.
+
+    Bodies without a Content-Length (chunked) are capped while streaming in ``_read_body``.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int) -> None:
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"content-length" and value.isdigit() and int(value) > self.max_bytes:
+                    response = _json_response({"detail": "Request body too large"}, status_code=413)
+                    await response(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
+
+
+async def _read_body(request: Request, digest: Any | None = None) -> bytearray:
+    """Stream the request body into one buffer, pre-sized from Content-Length when present
+    (up to ``BODY_PRESIZE_MAX``).
+
+    If ``digest`` is given, each chunk is also fed to its ``update()`` as it arrives.
+    Raises 413 once the body exceeds ``MAX_BODY_BYTES`` and 408 if it takes longer than
+    ``BODY_TIMEOUT_SECONDS`` to arrive.
+    """
+    try:
+        length = int(request.headers.get("content-length", 0))
+    except ValueError:
+        length = 0
+    buf = bytearray(min(max(length, 0), BODY_PRESIZE_MAX))
+    pos = 0
+    try:
+        async with asyncio.timeout(BODY_TIMEOUT_SECONDS):
+            async for chunk in request.stream():
+                end = pos + len(chunk)
+                if end > MAX_BODY_BYTES:
+                    raise HTTPException(status_code=413, detail="Request body too large")
+                if digest is not None:
+                    digest.update(chunk)
+                if end <= len(buf):
+                    buf[pos:end] = chunk
+                else:
+                    del buf[pos:]
+                    buf += chunk
+                pos = end
+    except TimeoutError:
+        raise HTTPException(status_code=408, detail="Timed out reading request body") from None
+    del buf[pos:]
+    return buf
+
+
+def _parse_json(raw: bytes | bytearray) -> Any:
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body") from None
+
+
+def create_app(
+    webhook_secret: str,
+    on_event: EventCallback,
+    on_event_batch: BatchEventCallback | None = None,
+) -> FastAPI:
+    """Create a FastAPI application wired to push events into the agent system.
+
+    If ``on_event_batch`` is given, dispatch workers hand it every event already queued
+    (up to ``EVENT_BATCH_MAX``) in one call instead of calling ``on_event`` per event.
+    Callbacks are awaited to completion, so they should bound each event's hand-off
+    themselves (as ``BaseAgent.put_event`` does) rather than block indefinitely.
+
+    When ``webhook_secret`` is set, ``/webhooks/internal/linear`` and
+    ``/webhooks/internal/slack`` accept the same payloads from internal producers and
+    always require a valid ``X-Blake3-Mac`` header.
+    """
+
+    # Events are routed by background workers so the HTTP response doesn't wait on the agents.
+    queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=EVENT_QUEUE_MAX)
+
+    async def _dispatch_batch(batch: list[Event]) -> None:
+        if on_event_batch is not None:
+            await on_event_batch(batch)
+            return
+        for event in batch:
+            await on_event(event)
+
+    async def _dispatch_worker() -> None:
+        while True:
+            # Block for the first event, then take whatever else is already waiting; no
+            # flush timer is needed because a batch never waits to fill up.
+            batch = [await queue.get()]
+            while len(batch) < EVENT_BATCH_MAX and not queue.empty():
+                batch.append(queue.get_nowait())
+            # No batch-level timeout: cancelling part-way would drop the rest of the batch
+            # silently. The callbacks bound each event's hand-off and log what they drop.
+            try:
+                await _dispatch_batch(batch)
+            except Exception:
+                logger.exception("Event dispatch failed for batch of %d event(s): %s", len(batch), batch)
+
+    @asynccontextmanager
+    async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+        workers = [asyncio.create_task(_dispatch_worker()) for _ in range(EVENT_WORKERS)]
+        try:
+            yield
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    app = FastAPI(
+        title="AI Company Webhook Server",
+        version="1.0.0",
+        lifespan=_lifespan,
+    )
+    app.add_middleware(_BodySizeLimit, max_bytes=MAX_BODY_BYTES)
+
+    # Keyed once; each request copies the padded-key states instead of re-deriving them.
+    # hashlib's OpenSSL backend selects SHA-NI/ARMv8 SHA instructions at runtime.
+    inner_state, outer_state = _hmac_sha256_states(webhook_secret.encode())
+
+    def _parse_signature(signature: str) -> bytes | None:
+        if not signature.startswith("sha256="):
+            return None
+        try:
+            return bytes.fromhex(signature[7:])
+        except ValueError:
+            return None
+
+    def _verify_signature(inner: Any, received: bytes) -> bool:
+        """Finish the HMAC whose inner state has been fed the whole payload, and compare."""
+        outer = outer_state.copy()
+        outer.update(inner.digest())
+        return hmac.compare_digest(outer.digest(), received)
+
+    blake3_key = blake3.blake3(webhook_secret.encode(), derive_key_context=BLAKE3_KEY_CONTEXT).digest()
+
+    async def _read_internal_body(request: Request) -> bytearray:
+        """Read a body that must carry a valid X-Blake3-Mac, hashing it as it streams in."""
+        try:
+            received = bytes.fromhex(request.headers.get("x-blake3-mac", ""))
+        except ValueError:
+            received = b""
+        if not received:
+            raise HTTPException(status_code=401, detail="Invalid signature")
+        hasher = blake3.blake3(key=blake3_key)
+        raw = await _read_body(request, digest=hasher)
+        if not hmac.compare_digest(hasher.digest(), received):
+            raise HTTPException(status_code=401, detail="Invalid signature")
+        return raw
+
+    def _dispatch(event: Event) -> None:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            raise HTTPException(status_code=503, detail="Event queue full") from None
 
     @app.get("/health")
-    async def health() -> dict[str, str]:
-        return {"status": "ok"}
+    async def health() -> Response:
+        return Response(content=_HEALTH_BODY, media_type="application/json")
 
-    @app.post("/webhooks/linear")
-    async def linear_webhook(request: Request) -> dict[str, str]:
-        body = await request.json()
+    # Webhooks are plain Starlette routes (registered below): they only need the raw
+    # Request, so FastAPI's per-request dependency solving and response validation are skipped.
+    def _handle_linear(raw: bytearray) -> Response:
+        body = _parse_json(raw)
         action = body.get("action", "unknown")
         data = body.get("data", {})
-
-        event_map: dict[str, str] = {
-            "create": "linear_issue_created",
-            "update": "linear_issue_updated",
-            "remove": "linear_issue_removed",
-        }
-        event_kind = event_map.get(action, f"linear_{action}")
-        await on_event(Event(kind=event_kind, source="linear", payload=data))
+        event_kind = _LINEAR_EVENT_MAP.get(action) or f"linear_{action}"
+        _dispatch(Event(event_kind, "linear", data))
         logger.info("Linear webhook: %s", event_kind)
-        return {"received": event_kind}
-
-    @app.post("/webhooks/github")
-    async def github_webhook(
-        request: Request,
-        x_hub_signature_256: str = Header(""),
-        x_github_event: str = Header(""),
-    ) -> dict[str, str]:
-        raw = await request.body()
-        if webhook_secret and not _verify_signature(raw, x_hub_signature_256, webhook_secret):
-            raise HTTPException(status_code=401, detail="Invalid signature")
+        return _json_response({"received": event_kind})
+
+    async def linear_webhook(request: Request) -> Response:
+        return _handle_linear(await _read_body(request))
 
-        body = await request.json()
+    async def internal_linear_webhook(request: Request) -> Response:
+        return _handle_linear(await _read_internal_body(request))
+
+    async def github_webhook(request: Request) -> Response:
+        headers = request.headers
+        if not webhook_secret:
+            raw = await _read_body(request)
+        else:
+            # Reject malformed headers before reading the body, then MAC the body as it streams in.
+            if (received := _parse_signature(headers.get("x-hub-signature-256", ""))) is None:
+                raise HTTPException(status_code=401, detail="Invalid signature")
+            inner = inner_state.copy()
+            raw = await _read_body(request, digest=inner)
+            if not _verify_signature(inner, received):
+                raise HTTPException(status_code=401, detail="Invalid signature")
+
+        body = _parse_json(raw)
         action = body.get("action", "")
-        event_kind = f"github_{x_github_event}"
-        if action:
-            event_kind = f"{event_kind}_{action}"
+        event_kind = _github_event_kind(headers.get("x-github-event", ""), action)
 
-        await on_event(Event(kind=event_kind, source="github", payload=body))
+        _dispatch(Event(event_kind, "github", body))
         logger.info("GitHub webhook: %s", event_kind)
-        return {"received": event_kind}
+        return _json_response({"received": event_kind})
 
-    @app.post("/webhooks/slack")
-    async def slack_webhook(request: Request) -> dict[str, Any]:
-        body = await request.json()
+    def _handle_slack(raw: bytearray) -> Response:
+        # Answer Slack's URL verification challenge without a full JSON parse
+        if _SLACK_CHALLENGE_MARKER in raw[:256] and (m := _SLACK_CHALLENGE_RE.search(raw)):
+            return PlainTextResponse(m.group(1).decode())
 
-        # Handle Slack URL verification challenge
+        body = _parse_json(raw)
         if body.get("type") == "url_verification":
-            return {"challenge": body["challenge"]}
+            return _json_response({"challenge": body["challenge"]})
 
         event_data = body.get("event", {})
         event_kind = f"slack_{event_data.get('type', 'unknown')}"
-        await on_event(Event(kind=event_kind, source="slack", payload=event_data))
+        _dispatch(Event(event_kind, "slack", event_data))
         logger.info("Slack webhook: %s", event_kind)
-        return {"ok": True}
+        return Response(content=_OK_BODY, media_type="application/json")
+
+    async def slack_webhook(request: Request) -> Response:
+        return _handle_slack(await _read_body(request))
+
+    async def internal_slack_webhook(request: Request) -> Response:
+        return _handle_slack(await _read_internal_body(request))
+
+    app.add_route("/webhooks/linear", linear_webhook, methods=["POST"])
+    app.add_route("/webhooks/github", github_webhook, methods=["POST"])
+    app.add_route("/webhooks/slack", slack_webhook, methods=["POST"])
+    if webhook_secret:
+        # Without a secret there is no key to verify against, so the internal routes stay off.
+        app.add_route("/webhooks/internal/linear", internal_linear_webhook, methods=["POST"])
+        app.add_route("/webhooks/internal/slack", internal_slack_webhook, methods=["POST"])
 
     return app
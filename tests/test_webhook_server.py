@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src import webhook_server
+from src.agents.base_agent import Event
+from src.webhook_server import _hmac_sha256_states, create_app
+
+SECRET = "test-secret"
+BODY = b'{"action":"opened","number":1}'
+
+
+async def _ignore(event: Event) -> None:
+    pass
+
+
+def _github_signature(body: bytes, secret: str = SECRET) -> str:
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    with TestClient(create_app(SECRET, _ignore)) as client:
+        yield client
+
+
+@pytest.mark.parametrize("key", [b"", b"short", b"k" * 64, b"k" * 65, bytes(range(256))])
+def test_hmac_sha256_states_match_hmac_new(key: bytes) -> None:
+    inner, outer = _hmac_sha256_states(key)
+    inner.update(BODY)
+    outer.update(inner.digest())
+    assert outer.digest() == hmac.new(key, BODY, hashlib.sha256).digest()
+
+
+def test_github_accepts_valid_signature(client: TestClient) -> None:
+    resp = client.post(
+        "/webhooks/github",
+        content=BODY,
+        headers={"X-Hub-Signature-256": _github_signature(BODY), "X-GitHub-Event": "pull_request"},
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"received": "github_pull_request_opened"}
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"X-Hub-Signature-256": _github_signature(BODY, secret="wrong-secret")},
+        {"X-Hub-Signature-256": _github_signature(BODY + b" ")},
+        {"X-Hub-Signature-256": "sha256=not-hex"},
+        {},
+    ],
+    ids=["wrong-key", "wrong-body", "malformed", "missing"],
+)
+def test_github_rejects_bad_signature(client: TestClient, headers: dict[str, str]) -> None:
+    resp = client.post("/webhooks/github", content=BODY, headers={**headers, "X-GitHub-Event": "pull_request"})
+    assert resp.status_code == 401
+
+
+@pytest.fixture
+def small_limit_client(monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    monkeypatch.setattr(webhook_server, "MAX_BODY_BYTES", 1024)
+    with TestClient(create_app(SECRET, _ignore)) as client:
+        yield client
+
+
+def test_rejects_oversized_content_length(small_limit_client: TestClient) -> None:
+    body = b"x" * 2048
+    resp = small_limit_client.post(
+        "/webhooks/github", content=body, headers={"X-Hub-Signature-256": _github_signature(body)}
+    )
+    assert resp.status_code == 413
+
+
+def test_rejects_oversized_chunked_body(small_limit_client: TestClient) -> None:
+    chunks = [b"x" * 512] * 4
+    # A generator body is sent with chunked transfer encoding and no Content-Length.
+    resp = small_limit_client.post(
+        "/webhooks/github",
+        content=iter(chunks),
+        headers={"X-Hub-Signature-256": _github_signature(b"".join(chunks))},
+    )
+    assert resp.status_code == 413